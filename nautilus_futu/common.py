@@ -2,14 +2,47 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Any
+
 from nautilus_trader.model.identifiers import InstrumentId, Symbol, Venue
+from nautilus_trader.model.objects import Currency, Price
+
+from nautilus_futu.constants import (
+    FUTU_MARKET_TO_VENUE,
+    FUTU_QOT_MARKET_TO_CURRENCY,
+    FUTU_VENUE,
+    VENUE_TO_FUTU_MARKET,
+)
+
+_NANOS_PER_SECOND = 1_000_000_000
+
+# Limits within which Price(float, precision) is verified to round to the same
+# raw value as Price.from_str(repr(float)): at most 9 decimals, and at most 15
+# significant digits so value * 10**precision stays exactly representable
+_FAST_PRICE_MAX_PRECISION = 9
+_FAST_PRICE_MAX_DIGITS = 15
+
+# One shared Currency instance per currency code
+_CURRENCY_BY_CODE: dict[str, Currency] = {
+    code: Currency.from_str(code) for code in {*FUTU_QOT_MARKET_TO_CURRENCY.values(), "USD"}
+}
+_DEFAULT_CURRENCY = _CURRENCY_BY_CODE["USD"]
 
-from nautilus_futu.constants import FUTU_MARKET_TO_VENUE, VENUE_TO_FUTU_MARKET, FUTU_VENUE
+# QotMarket -> Currency, indexed directly by market id (unmapped slots = USD)
+_CURRENCY_BY_MARKET: tuple[Currency, ...] = tuple(
+    _CURRENCY_BY_CODE[FUTU_QOT_MARKET_TO_CURRENCY.get(m, "USD")]
+    for m in range(max(FUTU_QOT_MARKET_TO_CURRENCY) + 1)
+)
 
 
+@lru_cache(maxsize=8192)
 def futu_security_to_instrument_id(market: int, code: str) -> InstrumentId:
     """Convert Futu security (market, code) to NautilusTrader InstrumentId.
 
+    Results are cached per (market, code), so repeated resolutions on the
+    push and report paths return the same InstrumentId instance.
+
     Parameters
     ----------
     market : int
@@ -42,3 +75,77 @@ def instrument_id_to_futu_security(instrument_id: InstrumentId) -> tuple[int, st
     market = VENUE_TO_FUTU_MARKET.get(venue, 0)
     code = instrument_id.symbol.value
     return market, code
+
+
+def futu_market_to_currency(market: int | None) -> Currency:
+    """Convert a Futu QotMarket to its trading Currency.
+
+    Every market shares one Currency instance per currency code; unmapped
+    or missing markets fall back to USD.
+
+    Parameters
+    ----------
+    market : int or None
+        Futu QotMarket value.
+
+    Returns
+    -------
+    Currency
+    """
+    if isinstance(market, int) and 0 <= market < len(_CURRENCY_BY_MARKET):
+        return _CURRENCY_BY_MARKET[market]
+    return _DEFAULT_CURRENCY
+
+
+def futu_timestamp_to_nanos(ts: float | None) -> int:
+    """Convert a Futu timestamp in seconds to UNIX nanoseconds.
+
+    Whole-second values (the usual case for K-lines and expiries) are scaled
+    with an exact integer multiply; fractional values fall back to float
+    scaling. Missing or zero timestamps map to 0.
+
+    Parameters
+    ----------
+    ts : float | None
+        Seconds since the UNIX epoch.
+
+    Returns
+    -------
+    int
+    """
+    if not ts:
+        return 0
+    secs = int(ts)
+    if secs == ts:
+        return secs * _NANOS_PER_SECOND
+    return int(ts * 1e9)
+
+
+def futu_value_to_price(value: Any) -> Price:
+    """Convert a Futu numeric price to a NautilusTrader Price.
+
+    Equivalent to ``Price.from_str(str(value))`` but skips Nautilus's string
+    parser for ints and plain floats: the precision is read off ``repr`` and
+    the number goes straight to the ``Price`` constructor.
+
+    Parameters
+    ----------
+    value : int | float | str
+        The price as received from OpenD.
+
+    Returns
+    -------
+    Price
+    """
+    value_type = type(value)
+    if value_type is int:
+        return Price(value, 0)
+    if value_type is float:
+        text = repr(value)
+        dot = text.find(".")
+        if dot >= 0 and "e" not in text:
+            precision = len(text) - dot - 1
+            digits = len(text) - 1 - (text[0] == "-")
+            if precision <= _FAST_PRICE_MAX_PRECISION and digits <= _FAST_PRICE_MAX_DIGITS:
+                return Price(value, precision)
+    return Price.from_str(str(value))
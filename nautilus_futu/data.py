@@ -290,6 +290,11 @@ class FutuLiveDataClient(LiveMarketDataClient):
         deltas = parse_push_order_book(data, instrument_id, ts_init)
         self._handle_data(deltas)
 
+    def _instrument_price_precision(self, instrument_id: InstrumentId) -> int | None:
+        """Return the cached instrument's price precision, or None if not loaded."""
+        instrument = self._cache.instrument(instrument_id)
+        return instrument.price_precision if instrument is not None else None
+
     def _handle_push_kl(self, data: dict) -> None:
         """Handle K-line push (proto 3007)."""
         from nautilus_futu.parsing.market_data import (
@@ -311,7 +316,9 @@ class FutuLiveDataClient(LiveMarketDataClient):
         if bar_type not in self._subscribed_bars:
             return
 
-        bars = parse_futu_bars(data.get("kl_list", []), bar_type)
+        bars = parse_futu_bars(
+            data.get("kl_list", []), bar_type, self._instrument_price_precision(instrument_id),
+        )
         for bar in bars:
             self._handle_data(bar)
 
@@ -551,7 +558,7 @@ class FutuLiveDataClient(LiveMarketDataClient):
                 limit,
             )
 
-            bars = parse_futu_bars(result, bar_type)
+            bars = parse_futu_bars(result, bar_type, self._instrument_price_precision(instrument_id))
             self._log.info(f"Received {len(bars)} bars from Futu for {bar_type}")
 
             self._handle_bars(
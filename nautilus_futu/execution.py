@@ -33,6 +33,7 @@ from nautilus_trader.model.orders import Order
 
 from nautilus_futu.common import (
     futu_security_to_instrument_id,
+    futu_timestamp_to_nanos,
     instrument_id_to_futu_security,
 )
 from nautilus_futu.config import FutuExecClientConfig
@@ -58,6 +59,7 @@ from nautilus_futu.parsing.orders import (
     nautilus_order_type_to_futu,
     parse_futu_fill_to_report,
     parse_futu_order_to_report,
+    parse_futu_orders,
     parse_futu_position_to_report,
     qot_market_to_currency,
     sec_market_to_qot_market,
@@ -478,7 +480,7 @@ class FutuLiveExecutionClient(LiveExecutionClient):
             sec_market = order_data.get("sec_market")
             market = sec_market_to_qot_market(sec_market)
             instrument_id = futu_security_to_instrument_id(market, order_data.get("code", ""))
-            ts_event = int((order_data.get("update_timestamp") or 0) * 1e9)
+            ts_event = futu_timestamp_to_nanos(order_data.get("update_timestamp"))
 
             if nt_status == OrderStatus.ACCEPTED:
                 self.generate_order_accepted(
@@ -540,7 +542,7 @@ class FutuLiveExecutionClient(LiveExecutionClient):
             sec_market = fill_data.get("sec_market")
             market = sec_market_to_qot_market(sec_market)
             instrument_id = futu_security_to_instrument_id(market, fill_data.get("code", ""))
-            ts_event = int((fill_data.get("create_timestamp") or 0) * 1e9)
+            ts_event = futu_timestamp_to_nanos(fill_data.get("create_timestamp"))
             currency = qot_market_to_currency(market)
 
             self.generate_order_filled(
@@ -711,6 +713,10 @@ class FutuLiveExecutionClient(LiveExecutionClient):
 
         return None
 
+    def _log_order_parse_error(self, order_dict: dict, error: Exception) -> None:
+        """Report an order that failed to parse through the adapter's logger."""
+        self._log.warning(f"Failed to parse order {order_dict.get('order_id')}: {error}")
+
     async def generate_order_status_reports(
         self,
         command,
@@ -730,16 +736,16 @@ class FutuLiveExecutionClient(LiveExecutionClient):
                     self._acc_id,
                     market,
                 )
+                new_orders = []
                 for order_dict in orders:
-                    try:
-                        order_id_str = str(order_dict.get("order_id"))
-                        if order_id_str in seen_ids:
-                            continue
-                        seen_ids.add(order_id_str)
-                        report = parse_futu_order_to_report(order_dict, account_id)
-                        reports.append(report)
-                    except Exception as e:
-                        self._log.warning(f"Failed to parse order {order_dict.get('order_id')}: {e}")
+                    order_id_str = str(order_dict.get("order_id"))
+                    if order_id_str in seen_ids:
+                        continue
+                    seen_ids.add(order_id_str)
+                    new_orders.append(order_dict)
+                reports.extend(
+                    parse_futu_orders(new_orders, account_id, self._log_order_parse_error),
+                )
             except Exception as e:
                 self._log.warning(f"Failed to query market {market} orders: {e}")
 
@@ -792,7 +798,7 @@ class FutuLiveExecutionClient(LiveExecutionClient):
     ) -> list[PositionStatusReport]:
         """Generate position status reports across all authorized markets."""
         instrument_id = command.instrument_id
-        from nautilus_futu.parsing.instruments import parse_futu_instrument
+        from nautilus_futu.parsing.instruments import parse_futu_instruments
 
         markets = self._trd_market_auth_list
         account_id = AccountId(f"FUTU-{self._acc_id}")
@@ -826,10 +832,8 @@ class FutuLiveExecutionClient(LiveExecutionClient):
                                     self._client.get_static_info, [(qot_market, code)],
                                 )
                                 if static_info:
-                                    for info in static_info:
-                                        inst = parse_futu_instrument(info)
-                                        if inst is not None:
-                                            self._cache.add_instrument(inst)
+                                    for inst in parse_futu_instruments(static_info):
+                                        self._cache.add_instrument(inst)
                             except Exception as e:
                                 self._log.warning(f"Auto-load instrument failed: {e}")
                     except Exception as e:
@@ -5,16 +5,17 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from nautilus_trader.model.identifiers import InstrumentId, Symbol
+from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.instruments import Equity, FuturesContract, OptionContract
 from nautilus_trader.model.enums import AssetClass, OptionKind
 from nautilus_trader.model.objects import Currency, Price, Quantity
 
-from nautilus_futu.common import futu_security_to_instrument_id
-from nautilus_futu.constants import (
-    FUTU_OPTION_TYPE_CALL,
-    FUTU_QOT_MARKET_TO_CURRENCY,
+from nautilus_futu.common import (
+    futu_market_to_currency,
+    futu_security_to_instrument_id,
+    futu_timestamp_to_nanos,
 )
+from nautilus_futu.constants import FUTU_OPTION_TYPE_CALL
 
 logger = logging.getLogger(__name__)
 
@@ -52,11 +53,6 @@ _SEC_TYPE_OPTION = 7
 _SEC_TYPE_FUTURE = 8
 
 
-def _determine_currency(market: int) -> Currency:
-    """Determine currency based on Futu market code."""
-    return Currency.from_str(FUTU_QOT_MARKET_TO_CURRENCY.get(market, "USD"))
-
-
 def parse_futu_instrument(
     static_info: dict[str, Any],
 ) -> Equity | OptionContract | FuturesContract | None:
@@ -76,35 +72,64 @@ def parse_futu_instrument(
     -------
     Equity | OptionContract | FuturesContract | None
     """
-    try:
-        market = static_info.get("market", 0)
-        code = static_info.get("code", "")
-        sec_type = static_info.get("sec_type", _SEC_TYPE_STOCK)
+    market = static_info.get("market", 0)
+    code = static_info.get("code", "")
+    if not code:
+        logger.warning("Failed to parse instrument: missing code")
+        return None
+    lot_size = static_info.get("lot_size", 1)
+    if not isinstance(lot_size, int) or lot_size <= 0:
+        logger.warning("Failed to parse instrument: invalid lot_size %r for %s", lot_size, code)
+        return None
+    sec_type = static_info.get("sec_type", _SEC_TYPE_STOCK)
 
+    try:
         instrument_id = futu_security_to_instrument_id(market, code)
-        currency = _determine_currency(market)
-
-        if sec_type == _SEC_TYPE_OPTION:
-            return _parse_futu_option(static_info, instrument_id, currency)
-        elif sec_type == _SEC_TYPE_FUTURE:
-            return _parse_futu_future(static_info, instrument_id, currency)
-        elif sec_type in (_SEC_TYPE_STOCK, _SEC_TYPE_ETF, _SEC_TYPE_WARRANT, _SEC_TYPE_CBBC):
-            return _parse_futu_equity(static_info, instrument_id, currency)
-        else:
+        currency = futu_market_to_currency(market)
+
+        builder = _INSTRUMENT_BUILDERS.get(sec_type)
+        if builder is None:
             logger.warning("Unknown sec_type %d for %s, treating as Equity", sec_type, code)
-            return _parse_futu_equity(static_info, instrument_id, currency)
+            builder = _parse_futu_equity
+        return builder(static_info, instrument_id, currency)
     except Exception as e:
         logger.warning("Failed to parse instrument: %s", e)
         return None
 
 
+def parse_futu_instruments(
+    static_info_list: list[dict[str, Any]],
+) -> list[Equity | OptionContract | FuturesContract]:
+    """Parse a batch of Futu static info dicts to NautilusTrader instruments.
+
+    Rows that fail to parse are dropped (the failure is logged by
+    ``parse_futu_instrument``).
+
+    Parameters
+    ----------
+    static_info_list : list[dict]
+        Static info dictionaries from Futu API.
+
+    Returns
+    -------
+    list[Equity | OptionContract | FuturesContract]
+    """
+    instruments: list[Equity | OptionContract | FuturesContract] = []
+    append = instruments.append
+    parse = parse_futu_instrument
+    for static_info in static_info_list:
+        instrument = parse(static_info)
+        if instrument is not None:
+            append(instrument)
+    return instruments
+
+
 def _parse_futu_equity(
     static_info: dict[str, Any],
     instrument_id: InstrumentId,
     currency: Currency,
 ) -> Equity:
     """Parse Futu static info to NautilusTrader Equity."""
-    code = static_info.get("code", "")
     lot_size = static_info.get("lot_size", 1)
     market = static_info.get("market", 0)
     spread = static_info.get("price_spread")
@@ -112,7 +137,7 @@ def _parse_futu_equity(
 
     return Equity(
         instrument_id=instrument_id,
-        raw_symbol=Symbol(code),
+        raw_symbol=instrument_id.symbol,
         currency=currency,
         price_precision=precision,
         price_increment=Price.from_str(increment),
@@ -128,7 +153,6 @@ def _parse_futu_option(
     currency: Currency,
 ) -> OptionContract:
     """Parse Futu static info to NautilusTrader OptionContract."""
-    code = static_info.get("code", "")
     lot_size = static_info.get("lot_size", 1)
 
     # Option-specific fields from get_static_info extended data
@@ -136,13 +160,12 @@ def _parse_futu_option(
     option_kind = OptionKind.CALL if futu_option_type == FUTU_OPTION_TYPE_CALL else OptionKind.PUT
 
     strike_price_val = static_info.get("strike_price", 0.0)
-    strike_timestamp = static_info.get("strike_timestamp", 0.0)
 
     # Underlying from option_owner fields
     owner_code = static_info.get("option_owner_code", "")
 
     # Convert strike_timestamp to nanoseconds for expiration_ns
-    expiration_ns = int(strike_timestamp * 1e9) if strike_timestamp else 0
+    expiration_ns = futu_timestamp_to_nanos(static_info.get("strike_timestamp", 0.0))
 
     market = static_info.get("market", 0)
     spread = static_info.get("price_spread")
@@ -150,7 +173,7 @@ def _parse_futu_option(
 
     return OptionContract(
         instrument_id=instrument_id,
-        raw_symbol=Symbol(code),
+        raw_symbol=instrument_id.symbol,
         asset_class=AssetClass.EQUITY,
         currency=currency,
         price_precision=precision,
@@ -177,8 +200,7 @@ def _parse_futu_future(
     lot_size = static_info.get("lot_size", 1)
 
     # Future-specific fields
-    last_trade_timestamp = static_info.get("last_trade_timestamp", 0.0)
-    expiration_ns = int(last_trade_timestamp * 1e9) if last_trade_timestamp else 0
+    expiration_ns = futu_timestamp_to_nanos(static_info.get("last_trade_timestamp", 0.0))
 
     market = static_info.get("market", 0)
     spread = static_info.get("price_spread")
@@ -186,7 +208,7 @@ def _parse_futu_future(
 
     return FuturesContract(
         instrument_id=instrument_id,
-        raw_symbol=Symbol(code),
+        raw_symbol=instrument_id.symbol,
         asset_class=AssetClass.INDEX,
         currency=currency,
         price_precision=precision,
@@ -199,3 +221,14 @@ def _parse_futu_future(
         ts_event=0,
         ts_init=0,
     )
+
+
+# Futu SecurityType -> instrument builder
+_INSTRUMENT_BUILDERS = {
+    _SEC_TYPE_STOCK: _parse_futu_equity,
+    _SEC_TYPE_ETF: _parse_futu_equity,
+    _SEC_TYPE_WARRANT: _parse_futu_equity,
+    _SEC_TYPE_CBBC: _parse_futu_equity,
+    _SEC_TYPE_OPTION: _parse_futu_option,
+    _SEC_TYPE_FUTURE: _parse_futu_future,
+}
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import Any
 
 from nautilus_trader.model.data import (
@@ -24,6 +25,7 @@ from nautilus_trader.model.enums import (
 from nautilus_trader.model.identifiers import InstrumentId, TradeId
 from nautilus_trader.model.objects import Price, Quantity
 
+from nautilus_futu.common import futu_timestamp_to_nanos, futu_value_to_price
 from nautilus_futu.constants import (
     FUTU_KL_TYPE_1MIN,
     FUTU_KL_TYPE_5MIN,
@@ -44,56 +46,39 @@ from nautilus_futu.constants import (
 )
 
 
+# (BarAggregation, step) -> Futu SubType
+_SUB_TYPE_MAP: dict[tuple[BarAggregation, int], int] = {
+    (BarAggregation.MINUTE, 1): FUTU_SUB_TYPE_KL_1MIN,
+    (BarAggregation.MINUTE, 5): FUTU_SUB_TYPE_KL_5MIN,
+    (BarAggregation.MINUTE, 15): FUTU_SUB_TYPE_KL_15MIN,
+    (BarAggregation.MINUTE, 30): FUTU_SUB_TYPE_KL_30MIN,
+    (BarAggregation.MINUTE, 60): FUTU_SUB_TYPE_KL_60MIN,
+    (BarAggregation.HOUR, 1): FUTU_SUB_TYPE_KL_60MIN,
+    (BarAggregation.DAY, 1): FUTU_SUB_TYPE_KL_DAY,
+}
+
+# (BarAggregation, step) -> Futu KLType
+_KL_TYPE_MAP: dict[tuple[BarAggregation, int], int] = {
+    (BarAggregation.MINUTE, 1): FUTU_KL_TYPE_1MIN,
+    (BarAggregation.MINUTE, 5): FUTU_KL_TYPE_5MIN,
+    (BarAggregation.MINUTE, 15): FUTU_KL_TYPE_15MIN,
+    (BarAggregation.MINUTE, 30): FUTU_KL_TYPE_30MIN,
+    (BarAggregation.MINUTE, 60): FUTU_KL_TYPE_60MIN,
+    (BarAggregation.HOUR, 1): FUTU_KL_TYPE_60MIN,
+    (BarAggregation.DAY, 1): FUTU_KL_TYPE_DAY,
+    (BarAggregation.WEEK, 1): FUTU_KL_TYPE_WEEK,
+    (BarAggregation.MONTH, 1): FUTU_KL_TYPE_MONTH,
+}
+
+
 def bar_spec_to_futu_sub_type(spec: BarSpecification) -> int | None:
     """Convert NautilusTrader BarSpecification to Futu SubType."""
-    if spec.aggregation == BarAggregation.MINUTE:
-        mapping = {
-            1: FUTU_SUB_TYPE_KL_1MIN,
-            5: FUTU_SUB_TYPE_KL_5MIN,
-            15: FUTU_SUB_TYPE_KL_15MIN,
-            30: FUTU_SUB_TYPE_KL_30MIN,
-            60: FUTU_SUB_TYPE_KL_60MIN,
-        }
-        return mapping.get(spec.step)
-    elif spec.aggregation == BarAggregation.HOUR:
-        if spec.step == 1:
-            return FUTU_SUB_TYPE_KL_60MIN
-        return None
-    elif spec.aggregation == BarAggregation.DAY:
-        if spec.step == 1:
-            return FUTU_SUB_TYPE_KL_DAY
-        return None
-    return None
+    return _SUB_TYPE_MAP.get((spec.aggregation, spec.step))
 
 
 def bar_spec_to_futu_kl_type(spec: BarSpecification) -> int | None:
     """Convert NautilusTrader BarSpecification to Futu KLType."""
-    if spec.aggregation == BarAggregation.MINUTE:
-        mapping = {
-            1: FUTU_KL_TYPE_1MIN,
-            5: FUTU_KL_TYPE_5MIN,
-            15: FUTU_KL_TYPE_15MIN,
-            30: FUTU_KL_TYPE_30MIN,
-            60: FUTU_KL_TYPE_60MIN,
-        }
-        return mapping.get(spec.step)
-    elif spec.aggregation == BarAggregation.HOUR:
-        if spec.step == 1:
-            return FUTU_KL_TYPE_60MIN
-        return None
-    elif spec.aggregation == BarAggregation.DAY:
-        if spec.step == 1:
-            return FUTU_KL_TYPE_DAY
-        return None
-    elif spec.aggregation == BarAggregation.WEEK:
-        if spec.step == 1:
-            return FUTU_KL_TYPE_WEEK
-        return None
-    elif spec.aggregation == BarAggregation.MONTH:
-        if spec.step == 1:
-            return FUTU_KL_TYPE_MONTH
-        return None
-    return None
+    return _KL_TYPE_MAP.get((spec.aggregation, spec.step))
 
 
 def parse_futu_quote_tick(
@@ -106,39 +91,51 @@ def parse_futu_quote_tick(
     Uses ``price_spread`` to derive bid/ask prices instead of fabricating
     a zero-spread tick from ``cur_price`` alone.
     """
-    cur_price = data.get("cur_price") or 0
-    spread = data.get("price_spread") or 0
+    get = data.get
+    cur_price = get("cur_price") or 0
+    spread = get("price_spread") or 0
     bid_price = cur_price
     ask_price = cur_price + spread
-    volume = max(data.get("volume") or 0, 1)  # avoid zero-quantity
+    # Quantity is immutable, so both sides can share one instance
+    size = Quantity.from_int(max(get("volume") or 0, 1))  # avoid zero-quantity
     return QuoteTick(
         instrument_id=instrument_id,
-        bid_price=Price.from_str(str(bid_price)),
-        ask_price=Price.from_str(str(ask_price)),
-        bid_size=Quantity.from_int(volume),
-        ask_size=Quantity.from_int(volume),
+        bid_price=futu_value_to_price(bid_price),
+        ask_price=futu_value_to_price(ask_price),
+        bid_size=size,
+        ask_size=size,
         ts_event=ts_init,
         ts_init=ts_init,
     )
 
 
+# Futu TickerDirection -> AggressorSide
+_AGGRESSOR_MAP: dict[int, AggressorSide] = {
+    FUTU_TICKER_DIR_BID: AggressorSide.BUYER,
+    FUTU_TICKER_DIR_ASK: AggressorSide.SELLER,
+}
+# Same mapping indexed directly by dir value (unmapped slots = NO_AGGRESSOR)
+_AGGRESSOR_BY_DIR: tuple[AggressorSide, ...] = tuple(
+    _AGGRESSOR_MAP.get(direction, AggressorSide.NO_AGGRESSOR)
+    for direction in range(max(_AGGRESSOR_MAP) + 1)
+)
+
+
 def parse_futu_trade_tick(
     data: dict[str, Any],
     instrument_id: InstrumentId,
     ts_init: int,
 ) -> TradeTick:
     """Parse Futu ticker to NautilusTrader TradeTick."""
-    direction = data.get("dir", 0)
-    if direction == FUTU_TICKER_DIR_BID:
-        aggressor_side = AggressorSide.BUYER
-    elif direction == FUTU_TICKER_DIR_ASK:
-        aggressor_side = AggressorSide.SELLER
+    direction = data.get("dir") or 0
+    if 0 <= direction < len(_AGGRESSOR_BY_DIR):
+        aggressor_side = _AGGRESSOR_BY_DIR[direction]
     else:
         aggressor_side = AggressorSide.NO_AGGRESSOR
 
     return TradeTick(
         instrument_id=instrument_id,
-        price=Price.from_str(str(data.get("price") or 0)),
+        price=futu_value_to_price(data.get("price") or 0),
         size=Quantity.from_int(max(data.get("volume") or 0, 1)),
         aggressor_side=aggressor_side,
         trade_id=TradeId(str(data.get("sequence", 0))),
@@ -147,36 +144,61 @@ def parse_futu_trade_tick(
     )
 
 
+# K-line dict fields read by parse_futu_bars, in unpacking order
+_KL_FIELDS = ("open_price", "high_price", "low_price", "close_price", "volume", "timestamp")
+
+
 def parse_futu_bars(
     kl_data: list[dict[str, Any]],
     bar_type: BarType,
+    price_precision: int | None = None,
 ) -> list[Bar]:
-    """Parse Futu K-line data to NautilusTrader Bars."""
-    bars = []
+    """Parse Futu K-line data to NautilusTrader Bars.
+
+    When ``price_precision`` is given (normally the instrument's), every
+    OHLC price is built at that precision directly from the float;
+    otherwise each price takes the precision of its own value.
+    """
+    bars: list[Bar] = []
+    # Bind loop-invariant callables once; this is the per-bar hot path
+    append = bars.append
+    if price_precision is None:
+        price_from_value = futu_value_to_price
+    else:
+        price_from_value = partial(Price, precision=price_precision)
+    qty_from_int = Quantity.from_int
     for kl in kl_data:
         if kl.get("is_blank", False):
             continue
 
+        try:
+            # Fast path: the Rust client always sets every K-line key
+            open_val, high_val, low_val, close_val, vol_val, ts_val = (
+                kl["open_price"],
+                kl["high_price"],
+                kl["low_price"],
+                kl["close_price"],
+                kl["volume"],
+                kl["timestamp"],
+            )
+        except KeyError:
+            open_val, high_val, low_val, close_val, vol_val, ts_val = map(kl.get, _KL_FIELDS)
+
         # Use `or 0` to handle explicit None values (key exists but value is None)
-        open_val = kl.get("open_price") or 0
-        high_val = kl.get("high_price") or 0
-        low_val = kl.get("low_price") or 0
-        close_val = kl.get("close_price") or 0
-        vol_val = max(kl.get("volume") or 0, 1)  # avoid zero-quantity
-        ts_val = kl.get("timestamp")
-        ts_ns = int(ts_val * 1e9) if ts_val else 0
-
-        bar = Bar(
-            bar_type=bar_type,
-            open=Price.from_str(str(open_val)),
-            high=Price.from_str(str(high_val)),
-            low=Price.from_str(str(low_val)),
-            close=Price.from_str(str(close_val)),
-            volume=Quantity.from_int(vol_val),
-            ts_event=ts_ns,
-            ts_init=ts_ns,
+        ts_ns = futu_timestamp_to_nanos(ts_val)
+
+        append(
+            Bar(
+                bar_type=bar_type,
+                open=price_from_value(open_val or 0),
+                high=price_from_value(high_val or 0),
+                low=price_from_value(low_val or 0),
+                close=price_from_value(close_val or 0),
+                volume=qty_from_int(max(vol_val or 0, 1)),  # avoid zero-quantity
+                ts_event=ts_ns,
+                ts_init=ts_ns,
+            )
         )
-        bars.append(bar)
 
     return bars
 
@@ -209,9 +231,14 @@ def parse_push_order_book(
     Uses full snapshot mode: CLEAR then ADD for each level.
     """
     deltas: list[OrderBookDelta] = []
+    # Bind loop-invariant enums and callables once; this runs per book level
+    append = deltas.append
+    add = BookAction.ADD
+    price_from_value = futu_value_to_price
+    qty_from_int = Quantity.from_int
 
     # First delta: CLEAR the book
-    deltas.append(
+    append(
         OrderBookDelta.clear(
             instrument_id=instrument_id,
             ts_event=ts_init,
@@ -220,44 +247,26 @@ def parse_push_order_book(
         )
     )
 
-    # Add bid levels
-    for bid in data.get("bids", []):
-        order = BookOrder(
-            side=OrderSide.BUY,
-            price=Price.from_str(str(bid["price"])),
-            size=Quantity.from_int(bid["volume"]),
-            order_id=0,
-        )
-        deltas.append(
-            OrderBookDelta(
-                instrument_id=instrument_id,
-                action=BookAction.ADD,
-                order=order,
-                ts_event=ts_init,
-                ts_init=ts_init,
-                flags=0,
-                sequence=0,
+    # Add bid levels, then ask levels
+    book_sides = ((OrderSide.BUY, data.get("bids", [])), (OrderSide.SELL, data.get("asks", [])))
+    for side, levels in book_sides:
+        for level in levels:
+            order = BookOrder(
+                side=side,
+                price=price_from_value(level["price"]),
+                size=qty_from_int(level["volume"]),
+                order_id=0,
             )
-        )
-
-    # Add ask levels
-    for ask in data.get("asks", []):
-        order = BookOrder(
-            side=OrderSide.SELL,
-            price=Price.from_str(str(ask["price"])),
-            size=Quantity.from_int(ask["volume"]),
-            order_id=0,
-        )
-        deltas.append(
-            OrderBookDelta(
-                instrument_id=instrument_id,
-                action=BookAction.ADD,
-                order=order,
-                ts_event=ts_init,
-                ts_init=ts_init,
-                flags=0,
-                sequence=0,
+            append(
+                OrderBookDelta(
+                    instrument_id=instrument_id,
+                    action=add,
+                    order=order,
+                    ts_event=ts_init,
+                    ts_init=ts_init,
+                    flags=0,
+                    sequence=0,
+                )
             )
-        )
 
     return OrderBookDeltas(instrument_id=instrument_id, deltas=deltas)
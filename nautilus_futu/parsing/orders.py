@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import logging
 from decimal import Decimal
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
 
 from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.execution.reports import (
@@ -26,9 +27,14 @@ from nautilus_trader.model.identifiers import (
     TradeId,
     VenueOrderId,
 )
-from nautilus_trader.model.objects import Currency, Money, Price, Quantity
+from nautilus_trader.model.objects import Currency, Money, Quantity
 
-from nautilus_futu.common import futu_security_to_instrument_id
+from nautilus_futu.common import (
+    futu_market_to_currency,
+    futu_security_to_instrument_id,
+    futu_timestamp_to_nanos,
+    futu_value_to_price,
+)
 from nautilus_futu.constants import (
     FUTU_QOT_MARKET_TO_CURRENCY,
     FUTU_TRD_SEC_MARKET_TO_QOT_MARKET,
@@ -53,6 +59,7 @@ from nautilus_futu.constants import (
     FUTU_ORDER_TYPE_NORMAL,
     FUTU_POSITION_SIDE_LONG,
     FUTU_POSITION_SIDE_SHORT,
+    FUTU_TIF_DAY,
     FUTU_TIF_GTC,
     FUTU_TRD_SIDE_BUY,
     FUTU_TRD_SIDE_BUY_BACK,
@@ -63,86 +70,120 @@ from nautilus_futu.constants import (
 logger = logging.getLogger(__name__)
 
 
+# NautilusTrader OrderSide <-> Futu TrdSide
+_ORDER_SIDE_TO_FUTU: dict[OrderSide, int] = {
+    OrderSide.BUY: FUTU_TRD_SIDE_BUY,
+    OrderSide.SELL: FUTU_TRD_SIDE_SELL,
+}
+_TRD_SIDE_MAP: dict[int, OrderSide] = {
+    FUTU_TRD_SIDE_BUY: OrderSide.BUY,
+    FUTU_TRD_SIDE_BUY_BACK: OrderSide.BUY,
+    FUTU_TRD_SIDE_SELL: OrderSide.SELL,
+    FUTU_TRD_SIDE_SELL_SHORT: OrderSide.SELL,
+}
+
+# NautilusTrader OrderType <-> Futu OrderType
+_ORDER_TYPE_TO_FUTU: dict[OrderType, int] = {
+    OrderType.LIMIT: FUTU_ORDER_TYPE_NORMAL,
+    OrderType.MARKET: FUTU_ORDER_TYPE_MARKET,
+}
+_ORDER_TYPE_MAP: dict[int, OrderType] = {
+    FUTU_ORDER_TYPE_NORMAL: OrderType.LIMIT,
+    FUTU_ORDER_TYPE_MARKET: OrderType.MARKET,
+}
+
+
 def nautilus_order_side_to_futu(side: OrderSide) -> int:
     """Convert NautilusTrader OrderSide to Futu TrdSide."""
-    if side == OrderSide.BUY:
-        return FUTU_TRD_SIDE_BUY
-    elif side == OrderSide.SELL:
-        return FUTU_TRD_SIDE_SELL
-    else:
+    result = _ORDER_SIDE_TO_FUTU.get(side)
+    if result is None:
         raise ValueError(f"Unsupported order side: {side}")
+    return result
 
 
 def futu_trd_side_to_nautilus(trd_side: int) -> OrderSide:
     """Convert Futu TrdSide to NautilusTrader OrderSide."""
-    if trd_side in (FUTU_TRD_SIDE_BUY, FUTU_TRD_SIDE_BUY_BACK):
-        return OrderSide.BUY
-    elif trd_side in (FUTU_TRD_SIDE_SELL, FUTU_TRD_SIDE_SELL_SHORT):
-        return OrderSide.SELL
-    else:
+    result = _TRD_SIDE_MAP.get(trd_side)
+    if result is None:
         raise ValueError(f"Unsupported Futu trade side: {trd_side}")
+    return result
 
 
 def nautilus_order_type_to_futu(order_type: OrderType) -> int:
     """Convert NautilusTrader OrderType to Futu OrderType."""
-    if order_type == OrderType.LIMIT:
-        return FUTU_ORDER_TYPE_NORMAL
-    elif order_type == OrderType.MARKET:
-        return FUTU_ORDER_TYPE_MARKET
-    else:
+    result = _ORDER_TYPE_TO_FUTU.get(order_type)
+    if result is None:
         raise ValueError(f"Unsupported order type: {order_type}")
+    return result
 
 
 def futu_order_type_to_nautilus(order_type: int) -> OrderType:
     """Convert Futu OrderType to NautilusTrader OrderType."""
-    if order_type == FUTU_ORDER_TYPE_NORMAL:
-        return OrderType.LIMIT
-    elif order_type == FUTU_ORDER_TYPE_MARKET:
-        return OrderType.MARKET
-    else:
+    result = _ORDER_TYPE_MAP.get(order_type)
+    if result is None:
         logger.warning("Unknown Futu order type %d, defaulting to LIMIT", order_type)
         return OrderType.LIMIT  # Default to LIMIT
+    return result
+
+
+# Futu OrderStatus -> NautilusTrader OrderStatus
+_ORDER_STATUS_MAP: dict[int, OrderStatus] = {
+    FUTU_ORDER_STATUS_UNSUBMITTED: OrderStatus.INITIALIZED,
+    FUTU_ORDER_STATUS_UNKNOWN: OrderStatus.INITIALIZED,
+    FUTU_ORDER_STATUS_WAITING_SUBMIT: OrderStatus.SUBMITTED,
+    FUTU_ORDER_STATUS_SUBMITTING: OrderStatus.SUBMITTED,
+    FUTU_ORDER_STATUS_SUBMIT_FAILED: OrderStatus.REJECTED,
+    FUTU_ORDER_STATUS_TIMEOUT: OrderStatus.REJECTED,
+    FUTU_ORDER_STATUS_SUBMITTED: OrderStatus.ACCEPTED,
+    FUTU_ORDER_STATUS_FILLED_PART: OrderStatus.PARTIALLY_FILLED,
+    FUTU_ORDER_STATUS_FILLED_ALL: OrderStatus.FILLED,
+    FUTU_ORDER_STATUS_CANCELLING_PART: OrderStatus.PENDING_CANCEL,
+    FUTU_ORDER_STATUS_CANCELLING_ALL: OrderStatus.PENDING_CANCEL,
+    FUTU_ORDER_STATUS_CANCELLED_PART: OrderStatus.CANCELED,
+    FUTU_ORDER_STATUS_CANCELLED_ALL: OrderStatus.CANCELED,
+    FUTU_ORDER_STATUS_DISABLED: OrderStatus.CANCELED,
+    FUTU_ORDER_STATUS_DELETED: OrderStatus.CANCELED,
+    FUTU_ORDER_STATUS_FILL_CANCELLED: OrderStatus.CANCELED,
+    FUTU_ORDER_STATUS_FAILED: OrderStatus.REJECTED,
+}
 
 
 def futu_order_status_to_nautilus(status: int) -> OrderStatus:
     """Convert Futu OrderStatus to NautilusTrader OrderStatus."""
-    if status in (FUTU_ORDER_STATUS_UNSUBMITTED, FUTU_ORDER_STATUS_UNKNOWN):
-        return OrderStatus.INITIALIZED
-    elif status in (FUTU_ORDER_STATUS_WAITING_SUBMIT, FUTU_ORDER_STATUS_SUBMITTING):
-        return OrderStatus.SUBMITTED
-    elif status in (FUTU_ORDER_STATUS_SUBMIT_FAILED, FUTU_ORDER_STATUS_TIMEOUT):
-        return OrderStatus.REJECTED
-    elif status == FUTU_ORDER_STATUS_SUBMITTED:
-        return OrderStatus.ACCEPTED
-    elif status == FUTU_ORDER_STATUS_FILLED_PART:
-        return OrderStatus.PARTIALLY_FILLED
-    elif status == FUTU_ORDER_STATUS_FILLED_ALL:
-        return OrderStatus.FILLED
-    elif status in (FUTU_ORDER_STATUS_CANCELLING_PART, FUTU_ORDER_STATUS_CANCELLING_ALL):
-        return OrderStatus.PENDING_CANCEL
-    elif status in (
-        FUTU_ORDER_STATUS_CANCELLED_PART,
-        FUTU_ORDER_STATUS_CANCELLED_ALL,
-        FUTU_ORDER_STATUS_DISABLED,
-        FUTU_ORDER_STATUS_DELETED,
-        FUTU_ORDER_STATUS_FILL_CANCELLED,
-    ):
-        return OrderStatus.CANCELED
-    elif status == FUTU_ORDER_STATUS_FAILED:
-        return OrderStatus.REJECTED
-    else:
+    result = _ORDER_STATUS_MAP.get(status)
+    if result is None:
         logger.warning("Unknown Futu order status %d, defaulting to INITIALIZED", status)
         return OrderStatus.INITIALIZED
+    return result
+
+
+# Futu TimeInForce -> NautilusTrader TimeInForce
+_TIME_IN_FORCE_MAP: dict[int, TimeInForce] = {
+    FUTU_TIF_DAY: TimeInForce.DAY,
+    FUTU_TIF_GTC: TimeInForce.GTC,
+}
+# Same mapping indexed directly by the Futu value (unmapped slots = DAY)
+_TIME_IN_FORCE_BY_FUTU: tuple[TimeInForce, ...] = tuple(
+    _TIME_IN_FORCE_MAP.get(tif, TimeInForce.DAY) for tif in range(max(_TIME_IN_FORCE_MAP) + 1)
+)
 
 
 def futu_time_in_force_to_nautilus(tif: int | None) -> TimeInForce:
     """Convert Futu TimeInForce to NautilusTrader TimeInForce."""
-    if tif is None:
-        return TimeInForce.DAY
-    elif tif == FUTU_TIF_GTC:
-        return TimeInForce.GTC
-    else:
-        return TimeInForce.DAY
+    if tif is not None and 0 <= tif < len(_TIME_IN_FORCE_BY_FUTU):
+        return _TIME_IN_FORCE_BY_FUTU[tif]
+    return TimeInForce.DAY
+
+
+def _instrument_id_for(code: str, sec_market: int | None) -> InstrumentId:
+    """Return the InstrumentId for a Futu trade (code, sec_market) pair."""
+    return futu_security_to_instrument_id(sec_market_to_qot_market(sec_market), code)
+
+
+@lru_cache(maxsize=8192)
+def _venue_order_id(order_id: int) -> VenueOrderId:
+    """Return the (cached) VenueOrderId for a Futu order ID."""
+    return VenueOrderId(str(order_id))
 
 
 def parse_futu_order_to_report(
@@ -162,28 +203,27 @@ def parse_futu_order_to_report(
     -------
     OrderStatusReport
     """
-    code = order["code"]
-    sec_market = order.get("sec_market")
-    market = sec_market_to_qot_market(sec_market)
-    instrument_id = futu_security_to_instrument_id(market, code)
+    instrument_id = _instrument_id_for(order["code"], order.get("sec_market"))
 
     order_side = futu_trd_side_to_nautilus(order["trd_side"])
     order_type = futu_order_type_to_nautilus(order["order_type"])
     order_status = futu_order_status_to_nautilus(order["order_status"])
     time_in_force = futu_time_in_force_to_nautilus(order.get("time_in_force"))
 
-    qty = Quantity.from_raw(round(order["qty"] * 1e9), precision=9)
-    filled_qty = Quantity.from_raw(round((order.get("fill_qty") or 0.0) * 1e9), precision=9)
-    price = Price.from_str(str(order.get("price") or 0)) if order.get("price") else None
-    avg_px = Decimal(str(order.get("fill_avg_price") or 0)) if order.get("fill_avg_price") else None
+    qty = Quantity(order["qty"], precision=9)
+    filled_qty = Quantity(order.get("fill_qty") or 0.0, precision=9)
+    raw_price = order.get("price")
+    price = futu_value_to_price(raw_price) if raw_price else None
+    fill_avg_price = order.get("fill_avg_price")
+    avg_px = Decimal(str(fill_avg_price)) if fill_avg_price else None
 
-    ts_accepted = int((order.get("create_timestamp") or 0) * 1e9)
-    ts_last = int((order.get("update_timestamp") or 0) * 1e9)
+    ts_accepted = futu_timestamp_to_nanos(order.get("create_timestamp"))
+    ts_last = futu_timestamp_to_nanos(order.get("update_timestamp"))
 
     return OrderStatusReport(
         account_id=account_id,
         instrument_id=instrument_id,
-        venue_order_id=VenueOrderId(str(order["order_id"])),
+        venue_order_id=_venue_order_id(order["order_id"]),
         order_side=order_side,
         order_type=order_type,
         time_in_force=time_in_force,
@@ -199,6 +239,43 @@ def parse_futu_order_to_report(
     )
 
 
+def parse_futu_orders(
+    orders: list[dict[str, Any]],
+    account_id: AccountId,
+    on_error: Callable[[dict[str, Any], Exception], None] | None = None,
+) -> list[OrderStatusReport]:
+    """Parse a batch of Futu order dicts to NautilusTrader OrderStatusReports.
+
+    Orders that fail to parse are dropped and reported through ``on_error``
+    (or logged when no callback is given).
+
+    Parameters
+    ----------
+    orders : list[dict]
+        Order dictionaries from PyFutuClient.get_order_list().
+    account_id : AccountId
+        The account ID.
+    on_error : Callable[[dict, Exception], None], optional
+        Called with the order dict and the exception for each failed order.
+
+    Returns
+    -------
+    list[OrderStatusReport]
+    """
+    reports: list[OrderStatusReport] = []
+    append = reports.append
+    parse = parse_futu_order_to_report
+    for order in orders:
+        try:
+            append(parse(order, account_id))
+        except Exception as e:
+            if on_error is not None:
+                on_error(order, e)
+            else:
+                logger.warning("Failed to parse order %s: %s", order.get("order_id"), e)
+    return reports
+
+
 def parse_futu_fill_to_report(
     fill: dict[str, Any],
     account_id: AccountId,
@@ -216,27 +293,25 @@ def parse_futu_fill_to_report(
     -------
     FillReport
     """
-    code = fill["code"]
     sec_market = fill.get("sec_market")
-    market = sec_market_to_qot_market(sec_market)
-    instrument_id = futu_security_to_instrument_id(market, code)
+    instrument_id = _instrument_id_for(fill["code"], sec_market)
 
     order_side = futu_trd_side_to_nautilus(fill["trd_side"])
 
-    ts_event = int((fill.get("create_timestamp") or 0) * 1e9)
+    ts_event = futu_timestamp_to_nanos(fill.get("create_timestamp"))
 
     # Derive currency from market for commission
-    currency = qot_market_to_currency(market)
+    currency = qot_market_to_currency(sec_market_to_qot_market(sec_market))
     commission = Money(0, currency)
 
     return FillReport(
         account_id=account_id,
         instrument_id=instrument_id,
-        venue_order_id=VenueOrderId(str(fill.get("order_id") or 0)),
+        venue_order_id=_venue_order_id(fill.get("order_id") or 0),
         trade_id=TradeId(str(fill["fill_id"])),
         order_side=order_side,
-        last_qty=Quantity.from_raw(round(fill["qty"] * 1e9), precision=9),
-        last_px=Price.from_str(str(fill["price"])),
+        last_qty=Quantity(fill["qty"], precision=9),
+        last_px=futu_value_to_price(fill["price"]),
         commission=commission,
         liquidity_side=LiquiditySide.NO_LIQUIDITY_SIDE,
         report_id=UUID4(),
@@ -245,6 +320,17 @@ def parse_futu_fill_to_report(
     )
 
 
+# Futu PositionSide -> NautilusTrader PositionSide
+_POSITION_SIDE_MAP: dict[int, PositionSide] = {
+    FUTU_POSITION_SIDE_LONG: PositionSide.LONG,
+    FUTU_POSITION_SIDE_SHORT: PositionSide.SHORT,
+}
+# Same mapping indexed directly by the Futu value (unmapped slots = LONG)
+_POSITION_SIDE_BY_FUTU: tuple[PositionSide, ...] = tuple(
+    _POSITION_SIDE_MAP.get(side, PositionSide.LONG) for side in range(max(_POSITION_SIDE_MAP) + 1)
+)
+
+
 def parse_futu_position_to_report(
     position: dict[str, Any],
     account_id: AccountId,
@@ -262,17 +348,14 @@ def parse_futu_position_to_report(
     -------
     PositionStatusReport
     """
-    code = position["code"]
-    sec_market = position.get("sec_market")
-    market = sec_market_to_qot_market(sec_market)
-    instrument_id = futu_security_to_instrument_id(market, code)
+    instrument_id = _instrument_id_for(position["code"], position.get("sec_market"))
 
     qty = position["qty"]
-    position_side_int = position.get("position_side", FUTU_POSITION_SIDE_LONG)
+    position_side_int = position.get("position_side") or FUTU_POSITION_SIDE_LONG
     if qty == 0:
         position_side = PositionSide.FLAT
-    elif position_side_int == FUTU_POSITION_SIDE_SHORT:
-        position_side = PositionSide.SHORT
+    elif 0 <= position_side_int < len(_POSITION_SIDE_BY_FUTU):
+        position_side = _POSITION_SIDE_BY_FUTU[position_side_int]
     else:
         position_side = PositionSide.LONG
 
@@ -280,28 +363,34 @@ def parse_futu_position_to_report(
         account_id=account_id,
         instrument_id=instrument_id,
         position_side=position_side,
-        quantity=Quantity.from_raw(round(abs(qty) * 1e9), precision=9),
+        quantity=Quantity(abs(qty), precision=9),
         report_id=UUID4(),
         ts_last=0,
         ts_init=0,
     )
 
 
+# TrdSecMarket -> QotMarket, indexed directly by sec_market (0 = unmapped)
+_QOT_MARKET_BY_SEC_MARKET: tuple[int, ...] = tuple(
+    FUTU_TRD_SEC_MARKET_TO_QOT_MARKET.get(m, 0)
+    for m in range(max(FUTU_TRD_SEC_MARKET_TO_QOT_MARKET) + 1)
+)
+
+
 def sec_market_to_qot_market(sec_market: int | None) -> int:
     """Map Futu TrdSecMarket to QotMarket for instrument_id resolution."""
     if sec_market is None:
         return 0
-    result = FUTU_TRD_SEC_MARKET_TO_QOT_MARKET.get(sec_market)
-    if result is None:
-        logger.warning("Unknown sec_market=%d, defaulting to 0", sec_market)
-        return 0
-    return result
+    if 0 <= sec_market < len(_QOT_MARKET_BY_SEC_MARKET):
+        result = _QOT_MARKET_BY_SEC_MARKET[sec_market]
+        if result:
+            return result
+    logger.warning("Unknown sec_market=%d, defaulting to 0", sec_market)
+    return 0
 
 
 def qot_market_to_currency(market: int) -> Currency:
     """Map QotMarket to default currency for commission."""
-    code = FUTU_QOT_MARKET_TO_CURRENCY.get(market)
-    if code is None:
+    if market not in FUTU_QOT_MARKET_TO_CURRENCY:
         logger.warning("Unknown QotMarket=%d, defaulting to USD", market)
-        code = "USD"
-    return Currency.from_str(code)
+    return futu_market_to_currency(market)
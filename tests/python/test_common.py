@@ -1,9 +1,14 @@
 """Tests for Futu common utilities."""
 
 import pytest
+from nautilus_trader.model.currencies import HKD, USD
+from nautilus_trader.model.objects import Price
 
 from nautilus_futu.common import (
+    futu_market_to_currency,
     futu_security_to_instrument_id,
+    futu_timestamp_to_nanos,
+    futu_value_to_price,
     instrument_id_to_futu_security,
 )
 from nautilus_futu.constants import FUTU_VENUE, HKEX_VENUE, NYSE_VENUE, SSE_VENUE
@@ -22,6 +27,12 @@ class TestSymbolConversion:
         assert instrument_id.symbol.value == "AAPL"
         assert instrument_id.venue == NYSE_VENUE
 
+    def test_repeated_conversion_returns_same_instance(self):
+        first = futu_security_to_instrument_id(1, "00700")
+        second = futu_security_to_instrument_id(1, "00700")
+        assert first is second
+        assert futu_security_to_instrument_id(11, "00700") is not first
+
     def test_cn_sh_security_to_instrument_id(self):
         instrument_id = futu_security_to_instrument_id(21, "600519")
         assert instrument_id.symbol.value == "600519"
@@ -119,3 +130,63 @@ class TestInstrumentIdEdgeCases:
         market, code = instrument_id_to_futu_security(instrument_id)
         assert market == 0
         assert code == "XYZ"
+
+
+class TestTimestampToNanos:
+    """Tests for futu_timestamp_to_nanos."""
+
+    def test_whole_seconds_exact(self):
+        assert futu_timestamp_to_nanos(1718400000.0) == 1718400000000000000
+
+    def test_int_input(self):
+        assert futu_timestamp_to_nanos(1718400000) == 1718400000000000000
+
+    def test_fractional_seconds(self):
+        assert futu_timestamp_to_nanos(1.5) == 1_500_000_000
+
+    def test_none_and_zero(self):
+        assert futu_timestamp_to_nanos(None) == 0
+        assert futu_timestamp_to_nanos(0.0) == 0
+
+
+class TestValueToPrice:
+    """futu_value_to_price must match Price.from_str(str(value)) exactly."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            0,
+            105,
+            350.6,
+            345.0,
+            0.001,
+            181.413,
+            362.001 + 0.2,
+            177.38046905246375,
+            1e-05,
+            12345.678901234,
+            123456789.12345679,
+            -123456789.12345679,
+        ],
+    )
+    def test_matches_from_str(self, value):
+        expected = Price.from_str(str(value))
+        result = futu_value_to_price(value)
+        assert result == expected
+        assert result.precision == expected.precision
+        assert str(result) == str(expected)
+
+
+class TestMarketToCurrency:
+    """Tests for futu_market_to_currency."""
+
+    def test_hk_returns_hkd(self):
+        assert futu_market_to_currency(1) == HKD
+
+    @pytest.mark.parametrize("market", [0, 9999, -1, None])
+    def test_unmapped_market_returns_usd(self, market):
+        assert futu_market_to_currency(market) == USD
+
+    def test_same_currency_shares_instance(self):
+        assert futu_market_to_currency(1) is futu_market_to_currency(2)
+        assert futu_market_to_currency(9999) is futu_market_to_currency(11)
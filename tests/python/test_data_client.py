@@ -3,16 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from nautilus_trader.model.data import QuoteTick, TradeTick
+from nautilus_trader.model.data import Bar, BarType, QuoteTick, TradeTick
 from nautilus_trader.model.enums import AggressorSide
 from nautilus_trader.model.identifiers import InstrumentId, Symbol, TradeId, Venue
 
 from nautilus_futu.common import futu_security_to_instrument_id
 from nautilus_futu.constants import (
+    FUTU_KL_TYPE_1MIN,
     FUTU_SUB_TYPE_BASIC,
     FUTU_SUB_TYPE_ORDER_BOOK,
     FUTU_SUB_TYPE_TICKER,
@@ -192,3 +194,49 @@ class TestRequestTradeTicks:
 
         result = mock_client.get_ticker(1, "00700", 100)
         assert len(result) == 0
+
+
+class TestHandlePushKl:
+    """Test _handle_push_kl bar precision."""
+
+    @staticmethod
+    def _push_kl(instrument):
+        from nautilus_futu.data import FutuLiveDataClient
+        from nautilus_futu.parsing.market_data import futu_kl_type_to_bar_spec
+
+        instrument_id = futu_security_to_instrument_id(1, "00700")
+        bar_type = BarType(instrument_id, futu_kl_type_to_bar_spec(FUTU_KL_TYPE_1MIN))
+        client = SimpleNamespace(
+            _cache=MagicMock(),
+            _log=MagicMock(),
+            _handle_data=MagicMock(),
+            _subscribed_bars={bar_type},
+        )
+        client._cache.instrument.return_value = instrument
+        client._instrument_price_precision = (
+            lambda iid: FutuLiveDataClient._instrument_price_precision(client, iid)
+        )
+        FutuLiveDataClient._handle_push_kl(client, {
+            "market": 1, "code": "00700", "kl_type": FUTU_KL_TYPE_1MIN,
+            "kl_list": [{
+                "open_price": 340, "high_price": 350.5, "low_price": 335.25,
+                "close_price": 345.125, "volume": 1000, "timestamp": 1704067200.0,
+            }],
+        })
+        client._cache.instrument.assert_called_once_with(instrument_id)
+        return client._handle_data.call_args.args[0]
+
+    def test_bars_use_instrument_precision(self):
+        """A cached instrument's price precision applies to every bar price."""
+        bar = self._push_kl(SimpleNamespace(price_precision=3))
+        assert isinstance(bar, Bar)
+        assert [str(p) for p in (bar.open, bar.high, bar.low, bar.close)] == [
+            "340.000", "350.500", "335.250", "345.125",
+        ]
+
+    def test_bars_fall_back_without_instrument(self):
+        """Without a cached instrument each price keeps its own precision."""
+        bar = self._push_kl(None)
+        assert [str(p) for p in (bar.open, bar.high, bar.low, bar.close)] == [
+            "340", "350.5", "335.25", "345.125",
+        ]
@@ -5,6 +5,14 @@ from __future__ import annotations
 import pytest
 
 
+@pytest.fixture(scope="module")
+def unconnected_client():
+    """A single never-connected PyFutuClient shared by the not-connected tests."""
+    from nautilus_futu._rust import PyFutuClient
+
+    return PyFutuClient()
+
+
 class TestConnectionSharing:
     """Tests for shared PyFutuClient via factories."""
 
@@ -48,50 +56,37 @@ class TestConnectionSharing:
 class TestPyFutuClientIsConnected:
     """Tests for PyFutuClient.is_connected()."""
 
-    def test_not_connected_initially(self):
-        from nautilus_futu._rust import PyFutuClient
-
-        client = PyFutuClient()
-        assert client.is_connected() is False
+    def test_not_connected_initially(self, unconnected_client):
+        assert unconnected_client.is_connected() is False
 
-    def test_is_connected_type(self):
-        from nautilus_futu._rust import PyFutuClient
-
-        client = PyFutuClient()
-        result = client.is_connected()
+    def test_is_connected_type(self, unconnected_client):
+        result = unconnected_client.is_connected()
         assert isinstance(result, bool)
 
 
 class TestStartPushAppendMode:
     """Tests for start_push append mode."""
 
-    def test_start_push_requires_connection(self):
+    def test_start_push_requires_connection(self, unconnected_client):
         """start_push should raise when not connected."""
-        from nautilus_futu._rust import PyFutuClient
-
-        client = PyFutuClient()
-        with pytest.raises(RuntimeError, match="Not connected"):
-            client.start_push([3005])
+        with pytest.raises(RuntimeError) as exc_info:
+            unconnected_client.start_push([3005])
+        assert "Not connected" in str(exc_info.value)
 
-    def test_poll_push_without_start_returns_none(self):
+    def test_poll_push_without_start_returns_none(self, unconnected_client):
         """poll_push before start_push should return None."""
-        from nautilus_futu._rust import PyFutuClient
-
-        client = PyFutuClient()
-        result = client.poll_push(10)
+        result = unconnected_client.poll_push(10)
         assert result is None
 
 
 class TestGetGlobalState:
     """Tests for get_global_state method."""
 
-    def test_get_global_state_requires_connection(self):
+    def test_get_global_state_requires_connection(self, unconnected_client):
         """get_global_state should raise when not connected."""
-        from nautilus_futu._rust import PyFutuClient
-
-        client = PyFutuClient()
-        with pytest.raises(RuntimeError, match="Not connected"):
-            client.get_global_state()
+        with pytest.raises(RuntimeError) as exc_info:
+            unconnected_client.get_global_state()
+        assert "Not connected" in str(exc_info.value)
 
 
 class TestRehabTypeConfig:
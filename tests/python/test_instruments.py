@@ -1,20 +1,49 @@
 """Tests for Futu instrument parsing."""
 
+from types import MappingProxyType
+
 import pytest
 
 from nautilus_trader.model.instruments import Equity, FuturesContract, OptionContract
 from nautilus_trader.model.enums import OptionKind
 
-from nautilus_futu.parsing.instruments import parse_futu_instrument
+from nautilus_futu.parsing.instruments import parse_futu_instrument, parse_futu_instruments
 from nautilus_futu.constants import HKEX_VENUE, NYSE_VENUE, SSE_VENUE, SZSE_VENUE
 
 
+@pytest.fixture(scope="module")
+def hk_equity_info():
+    """Read-only HK equity static info; derive variants with ``dict(info, ...)``."""
+    return MappingProxyType(
+        {"market": 1, "code": "00700", "name": "TENCENT", "lot_size": 100, "sec_type": 3}
+    )
+
+
+@pytest.fixture(scope="module")
+def us_call_option_info():
+    """Read-only US call option static info."""
+    return MappingProxyType(
+        {
+            "market": 11,
+            "code": "AAPL240119C00200000",
+            "name": "AAPL Call",
+            "lot_size": 100,
+            "sec_type": 7,
+            "option_type": 1,  # CALL
+            "option_owner_market": 11,
+            "option_owner_code": "AAPL",
+            "strike_price": 200.0,
+            "strike_time": "2024-01-19",
+            "strike_timestamp": 1705622400.0,
+        }
+    )
+
+
 class TestParseFutuInstrument:
     """Tests for parse_futu_instrument."""
 
-    def test_hk_equity(self):
-        info = {"market": 1, "code": "00700", "name": "TENCENT", "lot_size": 100, "sec_type": 3}
-        instrument = parse_futu_instrument(info)
+    def test_hk_equity(self, hk_equity_info):
+        instrument = parse_futu_instrument(hk_equity_info)
         assert instrument is not None
         assert isinstance(instrument, Equity)
         assert instrument.id.symbol.value == "00700"
@@ -62,6 +91,20 @@ class TestParseFutuInstrument:
         assert instrument is not None
         assert str(instrument.quote_currency) == "USD"
 
+    def test_negative_market_defaults_usd(self):
+        """Out-of-range market ids should fall back to USD instead of wrapping."""
+        info = {"market": -1, "code": "SOMETHING", "lot_size": 1}
+        instrument = parse_futu_instrument(info)
+        assert instrument is not None
+        assert str(instrument.quote_currency) == "USD"
+
+    def test_none_market_defaults_usd(self):
+        """A null market should fall back to USD instead of raising."""
+        info = {"market": None, "code": "X", "lot_size": 1}
+        instrument = parse_futu_instrument(info)
+        assert isinstance(instrument, Equity)
+        assert str(instrument.quote_currency) == "USD"
+
     def test_missing_fields_use_defaults(self):
         """Missing optional fields should use defaults."""
         info = {"market": 1, "code": "09988"}
@@ -86,17 +129,15 @@ class TestParseFutuInstrument:
         assert instrument is not None
         assert instrument.price_precision == 2
 
-    def test_price_precision_hk(self):
+    def test_price_precision_hk(self, hk_equity_info):
         """HK instruments should have price_precision=3 (market default)."""
-        info = {"market": 1, "code": "00700", "lot_size": 100}
-        instrument = parse_futu_instrument(info)
+        instrument = parse_futu_instrument(hk_equity_info)
         assert instrument is not None
         assert instrument.price_precision == 3
 
-    def test_price_precision_from_spread(self):
+    def test_price_precision_from_spread(self, hk_equity_info):
         """price_spread in static_info should override market default."""
-        info = {"market": 1, "code": "00700", "lot_size": 100, "price_spread": 0.2}
-        instrument = parse_futu_instrument(info)
+        instrument = parse_futu_instrument(dict(hk_equity_info, price_spread=0.2))
         assert instrument is not None
         assert instrument.price_precision == 1
 
@@ -110,31 +151,32 @@ class TestParseFutuInstrument:
         assert instrument.id.venue == SGX_VENUE
         assert str(instrument.quote_currency) == "SGD"
 
-    def test_lot_size_zero(self):
+    def test_lot_size_zero(self, hk_equity_info):
         """lot_size=0 triggers validation error, should return None gracefully."""
-        info = {"market": 1, "code": "00700", "lot_size": 0}
-        instrument = parse_futu_instrument(info)
+        instrument = parse_futu_instrument(dict(hk_equity_info, lot_size=0))
         assert instrument is None
 
-    def test_empty_code(self):
-        """Empty code should still parse without crashing."""
+    def test_empty_code(self, caplog):
+        """Empty code is rejected up front and logged."""
+        import logging
+
         info = {"market": 1, "code": "", "lot_size": 1}
-        # Should not raise
-        result = parse_futu_instrument(info)
-        # Result may be None or a valid instrument - just ensure no crash
-        # Should not raise -- either result is fine, just no crash
-        assert True
+        with caplog.at_level(logging.WARNING, logger="nautilus_futu.parsing.instruments"):
+            result = parse_futu_instrument(info)
+        assert result is None
+        assert "Failed to parse instrument" in caplog.text
 
-    def test_exception_logged(self, caplog):
+    def test_exception_logged(self, caplog, hk_equity_info):
         """When parsing fails with an exception, it should be logged."""
         import logging
 
         # Force an exception by passing invalid data type for lot_size
-        info = {"market": 1, "code": "00700", "lot_size": "not_a_number"}
+        info = dict(hk_equity_info, lot_size="not_a_number")
         with caplog.at_level(logging.WARNING, logger="nautilus_futu.parsing.instruments"):
             result = parse_futu_instrument(info)
-        if result is None:
-            assert "Failed to parse instrument" in caplog.text
+        assert result is None
+        assert "Failed to parse instrument" in caplog.text
+        assert "invalid lot_size" in caplog.text
 
 
 class TestETFParsing:
@@ -176,21 +218,8 @@ class TestWarrantCBBCParsing:
 class TestOptionParsing:
     """Tests for OPTION (sec_type=7) -> OptionContract."""
 
-    def test_call_option(self):
-        info = {
-            "market": 11,
-            "code": "AAPL240119C00200000",
-            "name": "AAPL Call",
-            "lot_size": 100,
-            "sec_type": 7,
-            "option_type": 1,  # CALL
-            "option_owner_market": 11,
-            "option_owner_code": "AAPL",
-            "strike_price": 200.0,
-            "strike_time": "2024-01-19",
-            "strike_timestamp": 1705622400.0,
-        }
-        instrument = parse_futu_instrument(info)
+    def test_call_option(self, us_call_option_info):
+        instrument = parse_futu_instrument(us_call_option_info)
         assert instrument is not None
         assert isinstance(instrument, OptionContract)
         assert instrument.option_kind == OptionKind.CALL
@@ -198,20 +227,14 @@ class TestOptionParsing:
         assert instrument.underlying == "AAPL"
         assert instrument.expiration_ns == int(1705622400.0 * 1e9)
 
-    def test_put_option(self):
-        info = {
-            "market": 11,
-            "code": "AAPL240119P00180000",
-            "name": "AAPL Put",
-            "lot_size": 100,
-            "sec_type": 7,
-            "option_type": 2,  # PUT
-            "option_owner_market": 11,
-            "option_owner_code": "AAPL",
-            "strike_price": 180.0,
-            "strike_time": "2024-01-19",
-            "strike_timestamp": 1705622400.0,
-        }
+    def test_put_option(self, us_call_option_info):
+        info = dict(
+            us_call_option_info,
+            code="AAPL240119P00180000",
+            name="AAPL Put",
+            option_type=2,  # PUT
+            strike_price=180.0,
+        )
         instrument = parse_futu_instrument(info)
         assert instrument is not None
         assert isinstance(instrument, OptionContract)
@@ -320,3 +343,30 @@ class TestUnknownSecType:
         instrument = parse_futu_instrument(info)
         assert instrument is not None
         assert isinstance(instrument, Equity)
+
+
+class TestParseFutuInstruments:
+    """Tests for the batch parse_futu_instruments entry point."""
+
+    def test_mixed_batch(self):
+        rows = [
+            {"market": 1, "code": "00700", "lot_size": 100, "sec_type": 3},
+            {"market": 11, "code": "AAPL_OPT", "lot_size": 100, "sec_type": 7},
+            {"market": 2, "code": "HSI_FUT", "lot_size": 1, "sec_type": 8},
+        ]
+        instruments = parse_futu_instruments(rows)
+        assert [type(i) for i in instruments] == [Equity, OptionContract, FuturesContract]
+        assert [i.id.symbol.value for i in instruments] == ["00700", "AAPL_OPT", "HSI_FUT"]
+
+    def test_failed_rows_dropped(self, us_call_option_info):
+        rows = [
+            {"market": 1, "code": "00700", "lot_size": 0},
+            dict(us_call_option_info, strike_timestamp="bad"),
+            {"market": 11, "code": "AAPL", "lot_size": 1},
+        ]
+        instruments = parse_futu_instruments(rows)
+        assert len(instruments) == 1
+        assert instruments[0].id.symbol.value == "AAPL"
+
+    def test_empty_list(self):
+        assert parse_futu_instruments([]) == []
@@ -101,6 +101,17 @@ class TestParseTradeTick:
         tick = parse_futu_trade_tick(data, hk_instrument_id, ts_init=4000)
         assert tick.aggressor_side == AggressorSide.NO_AGGRESSOR
 
+    def test_negative_dir_no_aggressor(self, hk_instrument_id):
+        """Negative dir values must not index from the end of the lookup table."""
+        data = {"price": 350.0, "volume": 100, "dir": -1, "sequence": 46}
+        tick = parse_futu_trade_tick(data, hk_instrument_id, ts_init=0)
+        assert tick.aggressor_side == AggressorSide.NO_AGGRESSOR
+
+    def test_none_dir_no_aggressor(self, hk_instrument_id):
+        data = {"price": 350.0, "volume": 100, "dir": None, "sequence": 47}
+        tick = parse_futu_trade_tick(data, hk_instrument_id, ts_init=0)
+        assert tick.aggressor_side == AggressorSide.NO_AGGRESSOR
+
     def test_missing_dir_defaults_no_aggressor(self, hk_instrument_id):
         """Missing dir field should default to NO_AGGRESSOR."""
         data = {"price": 10.0, "volume": 100, "sequence": 1}
@@ -179,6 +190,17 @@ class TestParseBars:
         bars = parse_futu_bars(kl_data, bar_type)
         assert bars[0].ts_event == 1718400000000000000  # seconds * 1e9
 
+    def test_instrument_price_precision(self, bar_type):
+        """A given price precision applies uniformly to every OHLC price."""
+        kl_data = [
+            {"open_price": 345.0, "high_price": 355.2, "low_price": 340, "close_price": 350.25, "volume": 500, "timestamp": 1000.0},
+        ]
+        bar = parse_futu_bars(kl_data, bar_type, price_precision=3)[0]
+        assert str(bar.open) == "345.000"
+        assert str(bar.high) == "355.200"
+        assert str(bar.low) == "340.000"
+        assert str(bar.close) == "350.250"
+
 
 class TestBarSpecConversionsExtended:
     """Extended tests for bar spec conversions (supplement to test_parsing.py)."""
@@ -21,6 +21,7 @@ from nautilus_trader.model.enums import (
     PriceType,
 )
 from nautilus_trader.model.identifiers import InstrumentId, Symbol, TradeId, Venue
+from nautilus_trader.model.objects import Price
 
 from nautilus_futu.common import futu_security_to_instrument_id
 from nautilus_futu.constants import (
@@ -175,6 +176,14 @@ class TestPushOrderBook:
         assert deltas.deltas[3].order.side == OrderSide.SELL
         assert float(deltas.deltas[3].order.price) == 345.2
 
+    def test_order_book_price_precision(self):
+        data = {"bids": [{"price": 345.0, "volume": 1000}], "asks": [{"price": 345.25, "volume": 500}]}
+        instrument_id = futu_security_to_instrument_id(1, "00700")
+        deltas = parse_push_order_book(data, instrument_id, 0)
+        assert deltas.deltas[1].order.price == Price.from_str("345.0")
+        assert deltas.deltas[2].order.price == Price.from_str("345.25")
+        assert deltas.deltas[2].order.price.precision == 2
+
     def test_order_book_empty(self):
         data = {
             "market": 1,